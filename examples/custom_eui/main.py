@@ -1,4 +1,5 @@
 import streams
+import timers
 from microchip.rn2483 import rn2483
 
 streams.serial()
@@ -29,10 +30,20 @@ while True:
     i += 1
     sleep(5000)
 
+# ping on a fixed 5 s schedule: sleep only the time left after each
+# transmission, and skip missed periods instead of bursting when behind
+t = timers.timer()
+t.start()
+next_ping = 0
 while True:
     try:
         print("sending ping, res:")
         print(rn2483.tx_uncnf("."))
     except rn2483Exception as e:
         print(e)
-    sleep(5000) 
+    next_ping += 5000
+    delay = next_ping - t.get()
+    if delay <= 0:
+        next_ping = t.get() + 5000
+        delay = 5000
+    sleep(delay)
@@ -1,4 +1,5 @@
 import streams
+import timers
 from microchip.rn2483 import rn2483
 
 streams.serial()
@@ -16,7 +17,21 @@ if not rn2483.init(SERIAL1, appeui, appkey, rst):
 print("sending first message, res:")
 print(rn2483.tx_uncnf('TTN'))
 
+# ping on a fixed 5 s schedule: sleep only the time left after each
+# transmission instead of a flat 5 s, so the cadence does not drift with
+# the variable uplink duration
+t = timers.timer()
+t.start()
+next_ping = 0
 while True:
     print("ping, res:")
     print(rn2483.tx_uncnf("."))
-    sleep(5000)
\ No newline at end of file
+    next_ping += 5000
+    delay = next_ping - t.get()
+    if delay <= 0:
+        # behind schedule (a busy uplink can block for seconds): skip the
+        # missed periods rather than bursting uplinks back to back on a
+        # duty-cycle-limited radio
+        next_ping = t.get() + 5000
+        delay = 5000
+    sleep(delay)
\ No newline at end of file
@@ -64,6 +64,7 @@ _ser = None
 _appeui = None
 _appkey = None
 _deveui  = None
+_hweui = None
 
 _pwridx = None
 _adr = None
@@ -73,6 +74,32 @@ _ar = None
 
 RESP_TIMEOUT = -1
 
+# hot constant commands, CRLF-terminated once at import so _pause/_resume and
+# the radio getters skip the per-call string concatenation in _send
+_CMD_PAUSE  = 'mac pause\r\n'
+_CMD_RESUME = 'mac resume\r\n'
+_CMD_GETSNR = 'radio get snr\r\n'
+_CMD_GETPWR = 'radio get pwr\r\n'
+
+# pause/get/resume pipelined as one write: the module answers the three
+# commands in order, so the responses can be collected in a single pass
+_CMD_SNR_BURST = _CMD_PAUSE + _CMD_GETSNR + _CMD_RESUME
+_CMD_PWR_BURST = _CMD_PAUSE + _CMD_GETPWR + _CMD_RESUME
+
+# whether the serial stream supports blocking readline(timeout=): probed on
+# first read, cleared once if the stream does not accept the keyword
+_blocking_read = True
+
+# single timer reused by _read's polling fallback, created on first use
+_rtimer = None
+
+# reusable RX buffer for the polling fallback: one upfront allocation holds
+# raw bytes across reads and is served line by line, sized for the longest
+# module response (a 230-byte downlink is ~470 hex chars plus the header)
+_rx_buf = bytearray(512)
+_rx_start = 0
+_rx_end = 0
+
 # def _free_buff():
 #     while _ser.available():
 #         _ser.read(1)
@@ -82,14 +109,74 @@ def _send(cmd, discard_resp = False):
     if discard_resp:
         _read()
 
+# drop the known CRLF terminator with a single slice: strip('\r\n') scans the
+# character set against both ends of the line on every response
+def _trim_eol(line):
+    n = len(line)
+    if n > 0 and line[n-1] == '\n':
+        n -= 1
+        if n > 0 and line[n-1] == '\r':
+            n -= 1
+        return line[0:n]
+    return line
+
 def _read(timeout = 2000):
-    t = timers.timer()
-    t.start()
-    while not _ser.available():
-        if t.get() > timeout:
+    global _blocking_read
+    if _blocking_read:
+        try:
+            line = _ser.readline(timeout = timeout)
+        except TypeError:
+            _blocking_read = False
+        else:
+            if not line:
+                return RESP_TIMEOUT
+            return _trim_eol(line)
+    # fallback: serve lines out of the reusable buffer, refilling it with
+    # chunk reads and polling with a coarse sleep to let other threads run
+    global _rtimer, _rx_start, _rx_end
+    if _rtimer is None:
+        _rtimer = timers.timer()
+        _rtimer.start()
+    else:
+        # reset then start: start is a no-op on a running timer but keeps
+        # the count advancing if reset left it stopped
+        _rtimer.reset()
+        _rtimer.start()
+    while True:
+        i = _rx_start
+        while i < _rx_end:
+            if _rx_buf[i] == 0x0a:
+                j = i
+                if j > _rx_start and _rx_buf[j-1] == 0x0d:
+                    j -= 1
+                line = str(_rx_buf[_rx_start:j])
+                _rx_start = i + 1
+                if _rx_start == _rx_end:
+                    _rx_start = 0
+                    _rx_end = 0
+                return line
+            i += 1
+        if _rtimer.get() > timeout:
             return RESP_TIMEOUT
-        sleep(2)
-    return _ser.readline().strip('\r\n')
+        avail = _ser.available()
+        if not avail:
+            sleep(10)
+            continue
+        if _rx_end == len(_rx_buf):
+            if _rx_start > 0:
+                # move the pending bytes to the front to make room
+                _rx_buf[0:_rx_end - _rx_start] = _rx_buf[_rx_start:_rx_end]
+                _rx_end -= _rx_start
+                _rx_start = 0
+            else:
+                # line longer than the whole buffer: drop it to stay in sync
+                _rx_end = 0
+        room = len(_rx_buf) - _rx_end
+        if avail > room:
+            avail = room
+        data = _ser.read(avail)
+        _rx_buf[_rx_end:_rx_end + len(data)] = data
+        _rx_end += len(data)
 
 def get_hweui(ser = None, rst = None):
     """
@@ -103,11 +190,22 @@ def get_hweui(ser = None, rst = None):
     
     and call get_hweui() before init().
 
+    The EUI is burned into the module, so it is queried once and cached.
+
     """
-    if ser is not None:
+    global _hweui
+    if ser is not None and _ser is None:
+        # bring the module up only once: re-entering init with a live serial
+        # port would skip the short_startup return, clobbering stored
+        # credentials and triggering a join with no valid keys
         init(ser, None, None, rst, short_startup = True)
-    _send('sys get hweui')
-    return _read()
+    if _hweui is None:
+        _send('sys get hweui')
+        res = _read()
+        if res == RESP_TIMEOUT:
+            return res
+        _hweui = res
+    return _hweui
 
 def get_ch_status(channel):
     """
@@ -138,12 +236,11 @@ def get_ar():
     """
 .. function:: get_ar()
 
-    Gets current automatic reply state ('on' or 'off').
+    Returns current automatic reply state ('on' or 'off').
 
     """
-    global _ar
     _send('mac get ar')
-    _ar = _read()
+    return _read()
 
 def set_ar(state):
     """
@@ -153,11 +250,8 @@ def set_ar(state):
     Currently setting ar to 'on' does not have consequences on downlink session.
 
     """
-    global _ar
     _send('mac set ar ' + state, discard_resp = True)
-    _send('mac get ar')
-    _ar = _read()
-    if _ar != state:
+    if get_ar() != state:
         raise rn2483Exception
 
 def set_retransmissions(n):
@@ -173,9 +267,11 @@ def set_retransmissions(n):
         raise rn2483Exception
 
 def _get_startup_msg():
-    while not _ser.available():
-        sleep(2)
-    while _ser.available():
+    # block until the startup banner arrives, then drain any trailing lines,
+    # buffered in _rx_buf or still pending on the serial port
+    while _read() == RESP_TIMEOUT:
+        pass
+    while _rx_end > _rx_start or _ser.available():
         _read()
 
 
@@ -232,15 +328,29 @@ def set_config():
     * *ar* sets the state of the automatic reply
 
     """
-    _send('mac set appeui ' + _appeui, discard_resp = True)
-    _send('mac set appkey ' + _appkey, discard_resp = True)
-    _send('mac set deveui ' + _deveui, discard_resp = True)
-    _send('mac set pwridx ' + _pwridx, discard_resp = True)
-    _send('mac set adr ' + _adr, discard_resp = True)
-    _send('mac set rx2 ' + _rx2, discard_resp = True)
-    set_retransmissions(_retx)
-    set_ar(_ar)
-    
+    # send every 'mac set' in one burst and collect the responses afterwards,
+    # overlapping command transmission with the module processing them
+    cmds = ('mac set appeui ' + _appeui,
+            'mac set appkey ' + _appkey,
+            'mac set deveui ' + _deveui,
+            'mac set pwridx ' + _pwridx,
+            'mac set adr ' + _adr,
+            'mac set rx2 ' + _rx2,
+            'mac set retx ' + str(_retx),
+            'mac set ar ' + _ar)
+    _ser.write('\r\n'.join(cmds) + '\r\n')
+    # drain every response before validating: raising mid-drain would leave
+    # replies queued on the UART and desynchronize all later commands
+    resps = []
+    for _ in range(len(cmds)):
+        resps.append(_read())
+    if resps[6] != 'ok' or resps[7] != 'ok':  # retx and ar must be accepted
+        raise rn2483Exception
+
+    # same verification set_ar performs
+    if get_ar() != _ar:
+        raise rn2483Exception
+
     _send('mac save', discard_resp = True)
 
 
@@ -255,23 +365,30 @@ def join():
     """
 
     _send('mac reset 868', discard_resp = True)
-    
-    set_config()
 
-    joined = False
+    set_config()
 
     for _ in range(3):
         _send('mac join otaa', discard_resp = True)
-        res = _read(timeout = 30000)
-        if res != RESP_TIMEOUT:
-            if res.startswith('accepted'):
-                joined = True
+        # wait for the verdict on a single 30 s budget per attempt: return
+        # the moment 'accepted'/'denied' arrives and let any unrelated line
+        # consume only the time it took, not a fresh 30 s window
+        t = timers.timer()
+        t.start()
+        while True:
+            left = 30000 - t.get()
+            if left <= 0:
                 break
-            elif res.startswith('denied'):
+            res = _read(timeout = left)
+            if res == RESP_TIMEOUT:
                 break
+            if res[0:8] == 'accepted':
+                return True
+            if res[0:6] == 'denied':
+                return False
         sleep(1000)
 
-    return joined
+    return False
 
 def init(ser, appeui, appkey, rst, join_lora=True, short_startup = False):
     """
@@ -318,20 +435,45 @@ def _2str(s):
         return r
     return '0'+r
 
-def _base16encode(data):
-    encoded = ''
+# byte value -> zero-padded hex pair, built once at import
+_HEX = []
+for _i in range(256):
+    _HEX.append(_2str(hex(_i, prefix='')))
+
+def _base16encode_str(data):
+    buf = []
     for xx in data:
-        if type(data) == PSTRING:
-            encoded += _2str(hex(ord(xx), prefix=''))
-        elif type(data) == PBYTEARRAY:
-            encoded += _2str(hex(xx, prefix =''))
-    return encoded
+        buf.append(_HEX[ord(xx)])
+    return ''.join(buf)
+
+def _base16encode_bytes(data):
+    buf = []
+    for xx in data:
+        buf.append(_HEX[xx])
+    return ''.join(buf)
+
+
+# hex digit -> nibble value, built once at import (both cases, like int(_,16))
+_DEHEX = {}
+for _i, _c in enumerate('0123456789abcdef'):
+    _DEHEX[_c] = _i
+for _i, _c in enumerate('0123456789ABCDEF'):
+    _DEHEX[_c] = _i
 
 def _base16tobytearray(data):
-    b_len = len(data)//2
-    b = bytearray(b_len)
-    for i in range(b_len):
-        b[i] = int(data[i*2:(i+1)*2], 16)
+    # single upfront allocation, filled by walking the hex digits directly
+    # so the loop carries no index arithmetic on the input string
+    b = bytearray(len(data)//2)
+    i = 0
+    hi = -1
+    for c in data:
+        v = _DEHEX[c]
+        if hi < 0:
+            hi = v
+        else:
+            b[i] = (hi << 4) | v
+            i += 1
+            hi = -1
     return b
 
 def tx_uncnf(data):
@@ -345,7 +487,9 @@ def tx_uncnf(data):
     a tuple (True, resp_data), where *resp_data* is a bytearray, otherwise.
 
     """
-    return _tx('mac tx uncnf 1 ' + _base16encode(data))
+    if type(data) == PSTRING:
+        return _tx('mac tx uncnf 1 ' + _base16encode_str(data))
+    return _tx('mac tx uncnf 1 ' + _base16encode_bytes(data))
 
 def tx_cnf(data):
     """
@@ -358,10 +502,81 @@ def tx_cnf(data):
     a tuple (True, resp_data), where *resp_data* is a bytearray, otherwise.
 
     """
-    return _tx('mac tx cnf 1 ' + _base16encode(data))
+    if type(data) == PSTRING:
+        return _tx('mac tx cnf 1 ' + _base16encode_str(data))
+    return _tx('mac tx cnf 1 ' + _base16encode_bytes(data))
+
+# batching thresholds: flush when the buffer nears the 222-byte payload limit
+# or when the oldest queued message has waited longer than the delay
+TX_BATCH_SIZE  = 200
+TX_BATCH_DELAY = 200
+
+_tx_buf = bytearray(0)
+_tx_deadline = 0
+
+def tx_batch(data):
+    """
+.. function:: tx_batch(data)
+
+    Queues *data* (a string or a bytearray) for transmission, coalescing
+    small messages into a single unconfirmed uplink to save airtime and
+    duty-cycle budget.
+    Each message is stored with a 1-byte length prefix so the receiver can
+    split the frame back into the original messages.
+
+    The buffer is flushed automatically when it reaches 200 bytes or when
+    the oldest queued message is older than 200 ms; call :ref:`flush() <flush>`
+    to force an immediate send.
+
+    Returns None while buffering, the transmission result of the coalesced
+    frame on flush.
+
+    """
+    global _tx_deadline
+    # the length prefix plus data must fit a single 222-byte uplink frame;
+    # reject oversized messages before they poison the shared buffer
+    if len(data) > 221:
+        raise rn2483Exception
+    if type(data) == PSTRING:
+        data = bytearray(data)
+    res = None
+    if len(_tx_buf) > 0 and len(_tx_buf) + 1 + len(data) > 222:
+        # this message would push the coalesced frame past the 222-byte
+        # payload limit: send what is pending first, then queue it
+        res = flush()
+    if len(_tx_buf) == 0:
+        _tx_deadline = timers.now() + TX_BATCH_DELAY
+    _tx_buf.append(len(data))
+    _tx_buf.extend(data)
+    if len(_tx_buf) >= TX_BATCH_SIZE or timers.now() > _tx_deadline:
+        return flush()
+    return res
+
+def flush():
+    """
+.. _flush:
+
+.. function:: flush()
+
+    Transmits any messages queued by :ref:`tx_batch() <tx_batch>` in a
+    single unconfirmed uplink.
+
+    Returns True if the buffer was empty, the transmission result otherwise.
+
+    """
+    global _tx_buf
+    if len(_tx_buf) == 0:
+        return True
+    buf = _tx_buf
+    _tx_buf = bytearray(0)
+    return _tx('mac tx uncnf 1 ' + _base16encode_bytes(buf))
 
 def _tx(cmd):
 
+    # back off exponentially while the module reports 'busy': short waits
+    # catch a briefly blocked MAC quickly, capped at the old 1 s pace so the
+    # worst case stays under the previous fixed-sleep total
+    backoff = 100
     for _ in range(10):
         _send(cmd)
         res = _read()
@@ -370,21 +585,27 @@ def _tx(cmd):
 
             if res == 'mac_tx_ok' or res == 'radio_tx_ok':
                 return True
-            if res.startswith('mac_rx'):
+            if res[0:6] == 'mac_rx':
                 # if ar == 'on':
                 #     res_2 = _read(timeout = 30000)
                 #     if res_2 != RESP_TIMEOUT:
                 #         if res_2.startswith('mac_rx'):
                 #             return (True, res.split(' ')[-1], res_2.split(' ')[-1])
                 #     return (True, res.split(' ')[-1], None)
-                return (True, _base16tobytearray(res.split(' ')[-1]))
+                # take the hex payload after the last space directly: split
+                # would tokenize the whole ~470-char downlink line into a list
+                return (True, _base16tobytearray(res[res.rfind(' ')+1:]))
 
             raise rn2483Exception
 
         if not res == 'busy':
             print(res)
             raise rn2483Exception
-        sleep(1000)
+        sleep(backoff)
+        if backoff < 1000:
+            backoff *= 2
+            if backoff > 1000:
+                backoff = 1000
 
 
 def get_snr():
@@ -394,18 +615,17 @@ def get_snr():
     Returns an integer between -128 and 127 representing the signal to noise ratio (SNR) for the last received packet.
 
     """
-    t = _pause()
+    _ser.write(_CMD_SNR_BURST)
+    t = _read()    # available pause time in ms
+    snr = _read()  # signed decimal number from -128 to 127
+    res = _read()  # ok
+
     if t == '0':
         raise rn2483Exception
-
-    _send('radio get snr')
-    snr = _read()  # signed decimal number from -128 to 127
-    
-    res = _resume()
     if not res == 'ok':
         print(res)
         raise rn2483Exception
-    
+
     return int(snr)
 
 def get_pwr():
@@ -415,28 +635,27 @@ def get_pwr():
     Returns an integer between -3 and 15 representing the current power level settings used in operation.
 
     """
-    t = _pause()
+    _ser.write(_CMD_PWR_BURST)
+    t = _read()    # available pause time in ms
+    pwr = _read()  # signed decimal number from -3 to 15
+    res = _read()  # ok
+
     if t == '0':
         raise rn2483Exception
-    
-    _send('radio get pwr')
-    pwr = _read()  # signed decimal number from -3 to 15
-    
-    res = _resume()
     if not res == 'ok':
         print(res)
         raise rn2483Exception
-    
+
     return int(pwr)
 
 # pause LoRaWAN stack functionality to allow radio configuration
 def _pause():
-    _send('mac pause')
+    _ser.write(_CMD_PAUSE)
     res = _read()  # available time in ms
     return res
 
 # resume LoRaWan stack functionality in order to continue normal functionality after being paused
 def _resume():
-    _send('mac resume')
+    _ser.write(_CMD_RESUME)
     res = _read()   # ok
     return res